@@ -5,215 +5,259 @@ Generates A4 PDFs with random Catalan sentences for calligraphy practice
 """
 
 import random
+# Only the lightweight reportlab modules are imported here; the PDF
+# machinery is imported where it is used so --find-fonts starts fast
 from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
 from reportlab.lib.units import mm
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 import argparse
 import os
+import re
+import sys
 import base64
 
-CATALAN_SENTENCES = [
-    "La pau comença amb un somriure.",
-    "El temps és or, però l'amistat és un tresor.",
-    "Cada dia és una nova oportunitat.",
-    "La paciència és la clau de l'èxit.",
-    "El coneixement és poder.",
-    "La bellesa està en els petits detalls.",
-    "Un viatge de mil llegües comença amb un pas.",
-    "L'amor és l'idioma universal.",
-    "Aprendre és créixer cada dia.",
-    "La natura ens ensenya la perfecció.",
-    "Els somnis són el motor del futur.",
-    "La música alimenta l'esperit.",
-    "Cada esforç té la seva recompensa.",
-    "La felicitat és un camí, no un destí.",
-    "L'alegria compartida es multiplica.",
-    "El silenci també és una resposta.",
-    "La humilitat és signe de grandesa.",
-    "Les paraules tenen poder i màgia.",
-    "Barcelona és una ciutat meravellosa.",
-    "El Mediterrani banya les nostres costes.",
-    "La tramuntana bufa amb força.",
-    "Les muntanyes de Montserrat són sagrades.",
-    "El pa amb tomàquet és deliciós.",
-    "La sardana és la nostra dansa tradicional.",
-    "Sant Jordi és la festa dels llibres.",
-    "Els castellers demostren força i equilibri.",
-    "La Rambla és plena de vida.",
-    "El Modernisme marca la ciutat.",
-    "Catalunya és una nació amb història pròpia.",
-    "Volem ser lliures i sobirans.",
-    "Independència per construir el nostre futur.",
-    "Som una nació sense estat propi.",
-    "El poble català té dret a l'autodeterminació.",
-    "Lluitarem pacíficament pels nostres drets.",
-    "La nostra llengua és senyal d'identitat.",
-    "El diàleg és l'eina de la pau.",
-    "Junts som més forts i units.",
-    "República catalana, somni de molts.",
-    "Treballem per un país millor per a tothom.",
-    # More inspirational and wisdom phrases
-    "La generositat enriqueix l'ànima.",
-    "Cada somriure il·lumina el món.",
-    "La perseverança supera qualsevol obstacle.",
-    "El respecte és la base de la convivència.",
-    "Un llibre és una finestra al món.",
-    "La creativitat no té límits.",
-    "L'amistat és el tresor més preuat.",
-    "El coratge es troba dins nostre.",
-    "La curiositat obre noves portes.",
-    "Viure és aprendre constantment.",
-    "L'esperança mai no mor.",
-    "Cada moment és un regal únic.",
-    "La vida és una aventura meravellosa.",
-    "Els records són el nostre tresor.",
-    "Somiar és el primer pas per crear.",
-    "La bondat sempre torna a nosaltres.",
-    "El present és el moment més important.",
-    "La vida creix on hi ha amor.",
-    # More Catalan culture and places
-    "Girona guarda segles d'història.",
-    "Tarragona té restes romanes fascinants.",
-    "El Pirineu català és majestuós.",
-    "Lleida és la porta als Pirineus.",
-    "La Costa Brava és un paradís mediterrani.",
-    "El Delta de l'Ebre és terra d'arròs.",
-    "Vic té un mercat medieval impressionant.",
-    "Cadaqués va inspirar Salvador Dalí.",
-    "Sitges celebra el Carnaval amb passió.",
-    "La Sagrada Família és una obra mestra.",
-    "El Park Güell és pura imaginació.",
-    "Les Rambles són el cor de Barcelona.",
-    "La Pedrera és arquitectura viva.",
-    "El Barri Gòtic respira història.",
-    "Montjuïc ofereix vistes meravelloses.",
-    # More values and inspirational
-    "L'educació transforma el món.",
-    "La solidaritat ens fa millors.",
-    "La cultura ens uneix i enriqueix.",
-    "La tolerància construeix ponts.",
-    "El futur es construeix avui.",
-    "La diversitat és la nostra riquesa.",
-    "L'esforç honest sempre dona fruits.",
-    "La llibertat d'expressió és essencial.",
-    "El progrés neix de la cooperació.",
-    "La igualtat és un dret de tots.",
-    "L'honestedat és la millor política.",
-    "La família és el nostre refugi.",
-    "Els valors es transmeten amb l'exemple.",
-]
+from catalan_sentences import SENTENCES as CATALAN_SENTENCES
+
+# Page layout, in points
+MARGIN = 20 * mm             # Left/right margin of practice lines
+TOP_MARGIN = 20 * mm
+BOTTOM_MARGIN = 20 * mm
+TICK = 2 * mm                # Half height of the starting mark
+TITLE_GAP = 15 * mm          # Space below the title on the first page
+HEADER_GAP = 8 * mm          # Space above each model sentence
+LINES_GAP = 10 * mm          # Space between model sentence and first line
+SENTENCE_SPACING = 20 * mm   # Space between different sentence blocks
+PAGE_NUMBER_Y = 10 * mm
+LINE_SPACING_DEFAULT = 12    # mm, see --spacing
+
+TITLE = "Pràctica de Cal·ligrafia"
 
 
 # Base64 encoded Dancing Script font (cursive/script style)
 # This is a lightweight cursive font perfect for calligraphy practice
 DANCING_SCRIPT_FONT_B64 = None  # Will use fallback
 
-def setup_cursive_font():
+# Resolved cursive font, kept for the whole process so repeated PDFs
+# don't probe the font directories or parse the TTF again
+_CURSIVE_CACHE = {}
+
+# Directories searched for cursive fonts, in priority order
+_FONT_DIRS = [
+    '/Library/Fonts',
+    os.path.expanduser('~/Library/Fonts'),
+    # Static versions in subdirectories
+    '/Library/Fonts/static',
+    os.path.expanduser('~/Library/Fonts/static'),
+    # System fonts (fallback)
+    '/usr/share/fonts/truetype/ubuntu',
+    '/usr/share/fonts/truetype/dejavu',
+]
+
+# Priority: Educational fonts for children (Playwrite), then simple cursive fonts
+# Playwrite fonts are specifically designed for teaching handwriting to children
+_PREFERRED = [
+    # Playwrite fonts - Educational (best for children)
+    # Check both variable and static versions
+    'PlaywriteES-VariableFont_wght.ttf',
+    'PlaywriteES-Regular.ttf',
+    # Other Playwrite variants
+    'PlaywriteUSModern-VariableFont_wght.ttf',
+    'PlaywriteUSTrad-VariableFont_wght.ttf',
+    # Simple cursive fonts from Google Fonts (good for children)
+    'GreatVibes-Regular.ttf',
+    'Allura-Regular.ttf',
+    'Pacifico-Regular.ttf',
+    'DancingScript-Regular.ttf',
+    'DancingScript-VariableFont_wght.ttf',
+    'LeagueScript-Regular.ttf',
+    # System fonts (fallback)
+    'Ubuntu-Italic.ttf',
+    'DejaVuSerif-Italic.ttf',
+]
+
+# Directory listings, read once per directory: {dir: {filename: path}}
+_FONT_DIR_ENTRIES = {}
+
+
+def _list_font_dir(font_dir):
+    """Return the {filename: path} listing of a font directory (cached)"""
+    entries = _FONT_DIR_ENTRIES.get(font_dir)
+    if entries is None:
+        try:
+            with os.scandir(font_dir) as it:
+                entries = {e.name: e.path for e in it}
+        except OSError:
+            entries = {}
+        _FONT_DIR_ENTRIES[font_dir] = entries
+    return entries
+
+
+def find_cursive_fonts():
+    """Yield installed cursive font paths, best candidate first"""
+    listings = [_list_font_dir(font_dir) for font_dir in _FONT_DIRS]
+    for name in _PREFERRED:
+        for entries in listings:
+            if name in entries:
+                yield entries[name]
+
+
+def _write_lines(lines):
+    """Write messages to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def setup_cursive_font(verbose=True):
     """Try to setup a cursive/script font for calligraphy"""
-    # Priority: Educational fonts for children (Playwrite), then simple cursive fonts
-    # Playwrite fonts are specifically designed for teaching handwriting to children
-    cursive_fonts = [
-        # Playwrite fonts - Educational (best for children)
-        # Check both variable and static versions
-        '/Library/Fonts/PlaywriteES-VariableFont_wght.ttf',
-        os.path.expanduser('~/Library/Fonts/PlaywriteES-VariableFont_wght.ttf'),
-        '/Library/Fonts/PlaywriteES-Regular.ttf',
-        os.path.expanduser('~/Library/Fonts/PlaywriteES-Regular.ttf'),
-        # Static versions in subdirectories
-        '/Library/Fonts/static/PlaywriteES-Regular.ttf',
-        os.path.expanduser('~/Library/Fonts/static/PlaywriteES-Regular.ttf'),
-        # Other Playwrite variants
-        '/Library/Fonts/PlaywriteUSModern-VariableFont_wght.ttf',
-        os.path.expanduser('~/Library/Fonts/PlaywriteUSModern-VariableFont_wght.ttf'),
-        '/Library/Fonts/PlaywriteUSTrad-VariableFont_wght.ttf',
-        os.path.expanduser('~/Library/Fonts/PlaywriteUSTrad-VariableFont_wght.ttf'),
-        # Simple cursive fonts from Google Fonts (good for children)
-        '/Library/Fonts/GreatVibes-Regular.ttf',
-        os.path.expanduser('~/Library/Fonts/GreatVibes-Regular.ttf'),
-        '/Library/Fonts/Allura-Regular.ttf',
-        os.path.expanduser('~/Library/Fonts/Allura-Regular.ttf'),
-        '/Library/Fonts/Pacifico-Regular.ttf',
-        os.path.expanduser('~/Library/Fonts/Pacifico-Regular.ttf'),
-        '/Library/Fonts/DancingScript-Regular.ttf',
-        os.path.expanduser('~/Library/Fonts/DancingScript-Regular.ttf'),
-        '/Library/Fonts/DancingScript-VariableFont_wght.ttf',
-        os.path.expanduser('~/Library/Fonts/DancingScript-VariableFont_wght.ttf'),
-        '/Library/Fonts/LeagueScript-Regular.ttf',
-        os.path.expanduser('~/Library/Fonts/LeagueScript-Regular.ttf'),
-        # System fonts (fallback)
-        '/usr/share/fonts/truetype/ubuntu/Ubuntu-Italic.ttf',
-        '/usr/share/fonts/truetype/dejavu/DejaVuSerif-Italic.ttf',
-    ]
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    
+    if _CURSIVE_CACHE.get('name'):
+        return _CURSIVE_CACHE['name']
+    
+    # Already registered in reportlab's process-wide registry (e.g. by other
+    # code using reportlab), so there is no need to parse the TTF again
+    if 'CursiveFont' in pdfmetrics.getRegisteredFontNames():
+        _CURSIVE_CACHE['name'] = 'CursiveFont'
+        return 'CursiveFont'
     
-    for font_path in cursive_fonts:
-        if os.path.exists(font_path):
-            try:
-                font_name = os.path.basename(font_path).replace('.ttf', '')
-                pdfmetrics.registerFont(TTFont('CursiveFont', font_path))
-                print(f"✓ Font cursiva carregada: {font_name}")
-                return 'CursiveFont'
-            except Exception as e:
-                # Debug: show which font failed
-                # print(f"  No es pot carregar {font_name}: {e}")
-                continue
+    for font_path in find_cursive_fonts():
+        try:
+            font_name = os.path.basename(font_path).replace('.ttf', '')
+            pdfmetrics.registerFont(TTFont('CursiveFont', font_path))
+            if verbose:
+                _write_lines([f"✓ Font cursiva carregada: {font_name}"])
+            _CURSIVE_CACHE['name'] = 'CursiveFont'
+            return 'CursiveFont'
+        except Exception as e:
+            # Debug: show which font failed
+            # print(f"  No es pot carregar {font_name}: {e}")
+            continue
     
     # Fallback: Use Helvetica-Oblique which is always available in reportlab
-    print("⚠ No s'ha trobat cap font cursiva instal·lada.")
-    print("  Utilitzant Helvetica-Oblique com a font per defecte.")
-    print("\n  Per millorar la qualitat, instal·la una d'aquestes fonts:")
-    print("  - Playwrite ES: https://fonts.google.com/specimen/Playwrite+ES")
-    print("  - Great Vibes: https://fonts.google.com/specimen/Great+Vibes")
-    print("  - Allura: https://fonts.google.com/specimen/Allura")
+    if verbose:
+        _write_lines([
+            "⚠ No s'ha trobat cap font cursiva instal·lada.",
+            "  Utilitzant Helvetica-Oblique com a font per defecte.",
+            "\n  Per millorar la qualitat, instal·la una d'aquestes fonts:",
+            "  - Playwrite ES: https://fonts.google.com/specimen/Playwrite+ES",
+            "  - Great Vibes: https://fonts.google.com/specimen/Great+Vibes",
+            "  - Allura: https://fonts.google.com/specimen/Allura",
+        ])
+    _CURSIVE_CACHE['name'] = 'Helvetica-Oblique'
     return 'Helvetica-Oblique'
 
 
-def draw_practice_line(c, y_position, page_width):
-    """Draw a single practice line for writing"""
-    margin = 20 * mm
-    
-    # Main writing line (solid black)
+def _setup_practice_line_state(c):
+    """Set the stroke state of the writing lines, once per page"""
     c.setStrokeColorRGB(0, 0, 0)
     c.setLineWidth(0.8)
-    c.line(margin, y_position, page_width - margin, y_position)
+
+
+def _emit_practice_lines(c, y_position, page_width, count, line_spacing):
+    """
+    Draw the practice lines of a sentence block
+    
+    Expects the stroke state from _setup_practice_line_state. The starting
+    marks are filled 1.5pt bars rather than strokes, so the stroke state
+    never has to change between blocks.
+    """
+    lines = c.beginPath()
+    marks = c.beginPath()
+    for i in range(count):
+        # Main writing line
+        lines.moveTo(MARGIN, y_position)
+        lines.lineTo(page_width - MARGIN, y_position)
+        # Small starting mark to show where to begin
+        marks.rect(MARGIN - 0.75, y_position - TICK, 1.5, 2 * TICK)
+        y_position -= line_spacing
     
-    # Small starting mark to show where to begin
-    c.setStrokeColorRGB(0.5, 0.5, 0.5)
-    c.setLineWidth(1.5)
-    c.line(margin, y_position - 2*mm, margin, y_position + 2*mm)
+    # Main writing lines (solid black)
+    c.drawPath(lines, stroke=1, fill=0)
+    
+    # Starting marks (gray)
+    c.setFillColorRGB(0.5, 0.5, 0.5)
+    c.drawPath(marks, stroke=0, fill=1)
 
 
-def draw_dotted_guide(c, sentence, y_position, page_width, cursive_font='Helvetica-Oblique'):
-    """Draw a dotted/light gray version of the sentence as a tracing guide"""
-    margin = 20 * mm
+def draw_sentence_block(c, sentence, y_position, page_width, cursive_font, lines_per_sentence, line_spacing,
+                        text=None):
+    """
+    Draw a sentence block: the model sentence to copy and its practice lines
+    
+    The practice lines go out as two paths and all the text (label, model
+    sentence and tracing guide) as a single text object. An already open
+    text object (e.g. holding the page title) can be passed as text to be
+    continued and drawn with the block.
+    y_position is the baseline of the model sentence.
+    """
+    first_line = y_position - LINES_GAP
+    _emit_practice_lines(c, first_line, page_width, lines_per_sentence, line_spacing)
+    
+    t = text if text is not None else c.beginText()
+    t.setTextOrigin(MARGIN, y_position)
+    
+    # "Model:" label
+    t.setFillGray(0.3)
+    t.setFont("Helvetica-Bold", 9)
+    t.textOut("Model: ")
     
-    # Draw the sentence in very light gray for tracing
-    c.setFillColorRGB(0.7, 0.7, 0.7)  # Light gray for tracing
+    # The sentence in cursive/script font (lletra lligada), right after
+    # the label: textOut advances the text position by itself
+    t.setFillGray(0)
+    t.setFont(cursive_font, 13)
+    t.textOut(sentence)
     
-    c.setFont(cursive_font, 13)
+    # Light gray version of the sentence on the first line, for tracing.
+    # Its baseline sits exactly ON the line. It is kept inline rather than
+    # shared as a form XObject: for sentences this short, the form object,
+    # its resource entry on every page and the Do call cost more than the text
+    # itself
+    t.setTextOrigin(MARGIN, first_line)
+    t.setFillGray(0.7)
+    t.textOut(sentence)
     
-    # Draw the sentence with baseline sitting exactly ON the line (y_position)
-    # The y_position IS the baseline, so we draw at y_position directly
-    c.drawString(margin, y_position, sentence)
+    c.drawText(t)
 
 
-def draw_sentence_header(c, sentence, y_position, page_width, cursive_font='ZapfChancery-MediumItalic'):
-    """Draw a sentence as an example to copy"""
-    margin = 20 * mm
+def pick_sentences(count):
+    """
+    Return count sentences in random order
     
-    # Draw "Model:" label
-    c.setFillColorRGB(0.3, 0.3, 0.3)
-    c.setFont("Helvetica-Bold", 9)
-    c.drawString(margin, y_position, "Model:")
+    Sentences don't repeat until all of them have been used; then the
+    list is reshuffled and the cycle starts over.
+    """
+    # A layout with no pages (e.g. --pages 0) can ask for a negative count
+    count = max(count, 0)
+    full_rounds, remainder = divmod(count, len(CATALAN_SENTENCES))
+    sentences = []
+    for _ in range(full_rounds):
+        sentences.extend(random.sample(CATALAN_SENTENCES, len(CATALAN_SENTENCES)))
+    # The last, partial round only needs as many sentences as are left
+    sentences.extend(random.sample(CATALAN_SENTENCES, remainder))
+    return sentences
+
+
+def compute_layout(y_position, lines_per_sentence, line_spacing_mm, block_gap):
+    """
+    Return the model sentence baselines of the blocks that fit on a page
     
-    # Draw the sentence in cursive/script font (lletra lligada)
-    c.setFillColorRGB(0, 0, 0)
-    c.setFont(cursive_font, 13)
-    c.drawString(margin + 15*mm, y_position, sentence)
+    y_position is where the first block starts. Every page but the first
+    has the same layout, so this only runs twice per PDF and the page loop
+    just walks the result.
+    """
+    baselines = []
+    y_limit = BOTTOM_MARGIN + (lines_per_sentence * line_spacing_mm) + SENTENCE_SPACING
+    while y_position > y_limit:
+        y_position -= HEADER_GAP
+        baselines.append(y_position)
+        y_position -= LINES_GAP
+        for i in range(lines_per_sentence):
+            y_position -= line_spacing_mm
+        y_position -= block_gap
+    return baselines
 
 
-def generate_calligraphy_pdf(filename, num_pages=5, lines_per_sentence=3, line_spacing=12, use_cursive_font=True):
+def generate_calligraphy_pdf(filename, num_pages=5, lines_per_sentence=3, line_spacing=LINE_SPACING_DEFAULT, use_cursive_font=True,
+                             compress=True, verbose=True):
     """
     Generate a PDF with calligraphy practice lines
     
@@ -223,78 +267,92 @@ def generate_calligraphy_pdf(filename, num_pages=5, lines_per_sentence=3, line_s
         lines_per_sentence: Number of practice lines per sentence
         line_spacing: Spacing between practice lines in mm
         use_cursive_font: Whether to use cursive font (lletra lligada)
+        compress: Whether to deflate page streams (smaller file) or
+            write them uncompressed (faster for many pages)
+        verbose: Whether to report the font and what was generated on stdout
     """
+    from reportlab.pdfgen import canvas
+    from reportlab.pdfbase import pdfmetrics
+    
     # Setup cursive font
     cursive_font = 'ZapfChancery-MediumItalic'  # Default fallback
     if use_cursive_font:
-        cursive_font = setup_cursive_font()
+        cursive_font = setup_cursive_font(verbose)
     
     page_width, page_height = A4
-    c = canvas.Canvas(filename, pagesize=A4)
+    c = canvas.Canvas(filename, pagesize=A4, pageCompression=1 if compress else 0)
     
     line_spacing_mm = line_spacing * mm
-    sentence_spacing = 20 * mm  # Space between different sentence blocks
-    top_margin = 20 * mm
-    bottom_margin = 20 * mm
+    block_gap = SENTENCE_SPACING - line_spacing_mm
     
-    # Create a shuffled copy of sentences to use without repetition
-    available_sentences = CATALAN_SENTENCES.copy()
-    random.shuffle(available_sentences)
+    # Lay out the first page (below the title) and the other pages once,
+    # then pick the sentences for all of them at once
+    first_page_layout = compute_layout(page_height - TOP_MARGIN - TITLE_GAP, lines_per_sentence,
+                                       line_spacing_mm, block_gap)
+    page_layout = compute_layout(page_height - TOP_MARGIN, lines_per_sentence,
+                                 line_spacing_mm, block_gap)
+    sentences = pick_sentences(len(first_page_layout) + (num_pages - 1) * len(page_layout))
     sentence_index = 0
     
+    # Page number labels, with their x position worked out up front
+    page_labels = [f"Pàgina {page + 1} de {num_pages}" for page in range(num_pages)]
+    page_label_xs = [(page_width - pdfmetrics.stringWidth(label, "Helvetica", 9)) / 2
+                     for label in page_labels]
+    title_x = (page_width - pdfmetrics.stringWidth(TITLE, "Helvetica-Bold", 16)) / 2
+    
     for page in range(num_pages):
-        y_position = page_height - top_margin
-        
-        # Add title on first page
+        # Add title on first page, sharing the text object of the first block
+        title = None
         if page == 0:
-            c.setFont("Helvetica-Bold", 16)
-            c.setFillColorRGB(0, 0, 0)
-            c.drawCentredString(page_width / 2, y_position, "Pràctica de Cal·ligrafia")
-            y_position -= 15 * mm
+            title = c.beginText(title_x, page_height - TOP_MARGIN)
+            title.setFont("Helvetica-Bold", 16)
+            title.setFillColorRGB(0, 0, 0)
+            title.textOut(TITLE)
+        
+        _setup_practice_line_state(c)
         
         # Draw sentences with practice lines
-        while y_position > bottom_margin + (lines_per_sentence * line_spacing_mm) + sentence_spacing:
-            # Get next sentence from shuffled list
-            sentence = available_sentences[sentence_index % len(available_sentences)]
-            sentence_index += 1
-            
-            # If we've used all sentences, reshuffle and start over
-            if sentence_index % len(available_sentences) == 0:
-                random.shuffle(available_sentences)
-            
-            # Draw the model sentence
-            y_position -= 8 * mm
-            draw_sentence_header(c, sentence, y_position, page_width, cursive_font)
-            
-            # Draw multiple practice lines for this sentence
-            y_position -= 10 * mm
-            for i in range(lines_per_sentence):
-                draw_practice_line(c, y_position, page_width)
-                
-                # On the first line, add dotted guide text to trace
-                if i == 0:
-                    draw_dotted_guide(c, sentence, y_position, page_width, cursive_font)
-                
-                y_position -= line_spacing_mm
-            
-            # Add space before next sentence
-            y_position -= (sentence_spacing - line_spacing_mm)
+        layout = first_page_layout if page == 0 else page_layout
+        page_sentences = sentences[sentence_index:sentence_index + len(layout)]
+        for y_position, sentence in zip(layout, page_sentences):
+            # Draw the model sentence and its practice lines
+            draw_sentence_block(c, sentence, y_position, page_width, cursive_font,
+                                lines_per_sentence, line_spacing_mm, text=title)
+            title = None
+        sentence_index += len(layout)
+        if title is not None:
+            # No room for any sentence block on the page
+            c.drawText(title)
         
         # Add page number at bottom
         c.setFont("Helvetica", 9)
         c.setFillColorRGB(0.5, 0.5, 0.5)
-        c.drawCentredString(page_width / 2, 10 * mm, f"Pàgina {page + 1} de {num_pages}")
+        c.drawString(page_label_xs[page], PAGE_NUMBER_Y, page_labels[page])
         
         if page < num_pages - 1:
             c.showPage()
     
     c.save()
-    print(f"PDF generat: {filename}")
-    print(f"  - Pàgines: {num_pages}")
-    print(f"  - Línies per frase: {lines_per_sentence}")
-    print(f"  - Espaiat entre línies: {line_spacing} mm")
-    print(f"  - Total frases úniques: {min(sentence_index, len(CATALAN_SENTENCES))}")
-    print(f"  - Font lletra lligada: {cursive_font if use_cursive_font else 'No'}")
+    if verbose:
+        print_summary(filename, num_pages, lines_per_sentence, line_spacing, sentence_index,
+                      cursive_font if use_cursive_font else None)
+
+
+def print_summary(filename, num_pages, lines_per_sentence, line_spacing, sentence_count, cursive_font):
+    """Print what was generated; cursive_font is None when not used"""
+    _write_lines([
+        f"PDF generat: {filename}",
+        f"  - Pàgines: {num_pages}",
+        f"  - Línies per frase: {lines_per_sentence}",
+        f"  - Espaiat entre línies: {line_spacing} mm",
+        f"  - Total frases úniques: {min(sentence_count, len(CATALAN_SENTENCES))}",
+        f"  - Font lletra lligada: {cursive_font or 'No'}",
+    ])
+
+
+# Font file names reported by --find-fonts
+_PLAYWRITE_FONTS_RE = re.compile(r'[Pp]laywrite')
+_CURSIVE_FONTS_RE = re.compile(r'Great|Allura|Dancing|Pacifico')
 
 
 def main():
@@ -321,7 +379,7 @@ def main():
     parser.add_argument(
         "-s", "--spacing",
         type=int,
-        default=12,
+        default=LINE_SPACING_DEFAULT,
         help="Espaiat entre línies de pràctica en mm (per defecte: 12)"
     )
     parser.add_argument(
@@ -329,6 +387,11 @@ def main():
         action="store_true",
         help="No utilitzar font de lletra lligada"
     )
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="No comprimir les pàgines (fitxer més gran però es genera més ràpid)"
+    )
     parser.add_argument(
         "--find-fonts",
         action="store_true",
@@ -349,9 +412,15 @@ def main():
             print(f"📁 Buscant a: {font_dir}")
             if os.path.exists(font_dir):
                 try:
-                    files = os.listdir(font_dir)
-                    playwrite = [f for f in files if 'Playwrite' in f or 'playwrite' in f]
-                    cursive = [f for f in files if any(x in f for x in ['Great', 'Allura', 'Dancing', 'Pacifico'])]
+                    # One pass over the directory; a name can be listed under both
+                    playwrite = []
+                    cursive = []
+                    with os.scandir(font_dir) as it:
+                        for entry in it:
+                            if _PLAYWRITE_FONTS_RE.search(entry.name):
+                                playwrite.append(entry.name)
+                            if _CURSIVE_FONTS_RE.search(entry.name):
+                                cursive.append(entry.name)
                     
                     if playwrite:
                         print("  ✓ Fonts Playwrite trobades:")
@@ -383,7 +452,8 @@ def main():
         num_pages=args.pages,
         lines_per_sentence=args.lines,
         line_spacing=args.spacing,
-        use_cursive_font=not args.no_cursive
+        use_cursive_font=not args.no_cursive,
+        compress=not args.no_compress
     )
 
 